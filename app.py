@@ -5,30 +5,126 @@ A web-based dashboard to visualize and manage expenses with interactive charts.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import io
 import json
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 import re
-from PIL import Image
+from PIL import Image, ImageOps
+# Tesseract's OpenMP pool reads this at start-up, so set it before any OCR backend loads
+os.environ.setdefault('OMP_THREAD_LIMIT', str(os.cpu_count() or 1))
 try:
     import pytesseract
     OCR_AVAILABLE = True
 except Exception:
     OCR_AVAILABLE = False
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+    OCR_AVAILABLE = True
+except Exception:
+    TESSEROCR_AVAILABLE = False
 try:
     from dateutil import parser as date_parser
     DATEUTIL_AVAILABLE = True
 except Exception:
     DATEUTIL_AVAILABLE = False
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except Exception:
+    MSGSPEC_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+# json and orjson decode errors are ValueErrors; msgspec's DecodeError is not
+JSON_DECODE_ERRORS = (ValueError, msgspec.DecodeError) if MSGSPEC_AVAILABLE else (ValueError,)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+try:
+    from st_aggrid import AgGrid, GridOptionsBuilder
+    AGGRID_AVAILABLE = True
+except Exception:
+    AGGRID_AVAILABLE = False
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    FEATHER_AVAILABLE = True
+except Exception:
+    FEATHER_AVAILABLE = False
 
 # Configuration
 DATA_FILE = "expenses.json"
+SAMPLE_FILE = "expenses_sample.json"
+# Typed columnar copy of DATA_FILE (the JSON stays the source of truth shared with the CLI)
+FEATHER_CACHE_FILE = "expenses.feather"
+# Built-in expense categories (custom names from the CLI are appended at load time)
+CATEGORIES = ["Food", "Transport", "Entertainment", "Shopping", "Bills", "Health", "Education", "Other"]
+# Description keywords used by auto_categorize
+CATEGORY_KEYWORDS = {
+    'Food': ['restaurant','cafe','grocery','supermarket','zomato','swiggy','dine','meal'],
+    'Transport': ['uber','ola','taxi','bus','metro','petrol','fuel','auto','parking'],
+    'Entertainment': ['netflix','movie','ticket','spotify','concert','streaming'],
+    'Shopping': ['flipkart','amazon','mall','shopping','store','clothing','shoes'],
+    'Bills': ['electricity','internet','bill','water','subscription','rent','emi'],
+    'Health': ['doctor','hospital','pharmacy','clinic','medicine'],
+    'Education': ['course','college','tuition','books','class'],
+}
+# One alternation over every keyword; the named group that matched is the category
+CATEGORY_RE = re.compile(
+    '|'.join(f"(?P<{cat}>" + '|'.join(re.escape(kw) for kw in kws) + ')' for cat, kws in CATEGORY_KEYWORDS.items()),
+    re.IGNORECASE
+)
+# Currency-prefixed (₹ / Rs) or plain numbers; the captured group is the digits only
+AMOUNT_RE = re.compile(r'(?:₹|Rs\.?)\s?(\d[\d,]*(?:\.\d{1,2})?)|\b(\d[\d,]*\.?\d{0,2})\b')
+# Receipt images are downscaled so their longest side is at most this many pixels before OCR
+OCR_MAX_DIM = 1600
+# Time-period selector labels mapped to time_rollup period codes
+PERIOD_FREQS = {'Daily': 'D', 'Weekly': 'W', 'Monthly': 'M', 'Quarterly': 'Q', 'Yearly': 'Y'}
+# Above this many points, charts switch from SVG to WebGL (Scattergl) traces
+WEBGL_POINT_THRESHOLD = 500
+# Minimum row count before the Numba aggregation kernels beat pandas groupby
+NUMBA_MIN_ROWS = 10_000
 # Vibrant modern palette for charts and UI accents
 CHART_COLORS = ['#0066FF', '#00C49A', '#FF8926', '#FF4D6D', '#9B6BFF', '#FF61AF', '#00A3E0']  # vibrant palette
 
+# Shared chart style as a Plotly template layered over the stock one. pio.templates lives in the
+# plotly module (kept in sys.modules), so it is only built on the first script run, not every rerun
+if 'expense' not in pio.templates:
+    _BORDERLESS = dict(marker=dict(line=dict(width=0)))
+    pio.templates['expense'] = go.layout.Template(
+        layout=dict(
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font={'family': 'Poppins, Inter, sans-serif', 'color': '#0f172a', 'size': 13},
+            hoverlabel=dict(
+                bgcolor="white",
+                font_size=13,
+                font_family="Inter"
+            ),
+            margin=dict(l=40, r=20, t=60, b=40),
+            transition=dict(duration=800, easing='cubic-in-out'),
+            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
+        ),
+        data=dict(
+            pie=[go.Pie(**_BORDERLESS)],
+            bar=[go.Bar(**_BORDERLESS)],
+            scatter=[go.Scatter(**_BORDERLESS)],
+            scattergl=[go.Scattergl(**_BORDERLESS)]
+        )
+    )
+    pio.templates.default = 'plotly+expense'
+
 # Page configuration
 st.set_page_config(
     page_title="ExpenseTracker Pro",
@@ -104,56 +200,296 @@ st.markdown("""
 
 # ==================== Data Functions ====================
 
-@st.cache_data
-def load_expenses():
-    """Load expenses from JSON file."""
-    if os.path.exists(DATA_FILE):
+def read_json_file(path):
+    """Parse a JSON file with the fastest available backend (msgspec, orjson, then json)."""
+    with open(path, 'rb') as file:
+        data = file.read()
+    if MSGSPEC_AVAILABLE:
+        return msgspec.json.decode(data)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# expenses.json indent, shared by the web app and the CLI whichever JSON backend each has;
+# 2 because orjson supports no other width, so in-place appends always match the file
+JSON_INDENT = 2
+
+
+def dump_json_bytes(obj):
+    """Serialize to indented UTF-8 JSON with the fastest available backend.
+
+    The indented layout keeps the file readable and diff-friendly, since the CLI shares it.
+    """
+    if MSGSPEC_AVAILABLE:
+        return msgspec.json.format(msgspec.json.encode(obj), indent=JSON_INDENT)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=JSON_INDENT).encode('utf-8')
+
+
+def _file_key(path):
+    """Return the (mtime_ns, size) cache key for a file."""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def data_file_key():
+    """(mtime_ns, size) of DATA_FILE, or None when it does not exist yet."""
+    return _file_key(DATA_FILE) if os.path.exists(DATA_FILE) else None
+
+
+def date_ordinal(date_str):
+    """Days since 1970-01-01 for a YYYY-MM-DD string (stored as each expense's 'date_ordinal')."""
+    return (datetime.strptime(date_str, '%Y-%m-%d') - datetime(1970, 1, 1)).days
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _load_cached(source_key):
+    """Parse DATA_FILE once per (mtime_ns, size) key; st.cache_data hands each caller its own copy.
+
+    Entries written before 'date_ordinal' existed are given one and the file is re-saved once;
+    dates that aren't YYYY-MM-DD are left without one (convert_to_dataframe then parses them).
+    """
+    expenses = read_json_file(DATA_FILE)
+    added = 0
+    for exp in expenses:
+        if 'date_ordinal' not in exp:
+            try:
+                exp['date_ordinal'] = date_ordinal(exp['date'])
+                added += 1
+            except (ValueError, TypeError, KeyError):
+                pass
+    if added:
         try:
-            with open(DATA_FILE, 'r') as file:
-                return json.load(file)
-        except (json.JSONDecodeError, IOError):
-            st.warning("Could not read expense file. Starting fresh.")
-            return []
-    return []
+            with open(DATA_FILE, 'wb') as file:
+                file.write(dump_json_bytes(expenses))
+        except IOError:
+            pass
+    return expenses
+
+
+def load_expenses():
+    """Load expenses from JSON file (see read_json_file for the decoder used).
+
+    Reruns reuse the parsed list from _load_cached until the file's mtime or size changes.
+    """
+    source_key = data_file_key()
+    if source_key is None:
+        return []
+    try:
+        return _load_cached(source_key)
+    except JSON_DECODE_ERRORS + (IOError,):
+        st.warning("Could not read expense file. Starting fresh.")
+        return []
 
 
 def save_expenses(expenses):
-    """Save expenses to JSON file."""
+    """Save expenses to JSON file (see dump_json_bytes for the encoder used)."""
     try:
-        with open(DATA_FILE, 'w') as file:
-            json.dump(expenses, file, indent=4)
+        with open(DATA_FILE, 'wb') as file:
+            file.write(dump_json_bytes(expenses))
         st.success("✓ Expenses saved successfully!")
-        st.cache_data.clear()
+        load_expenses_df.clear()
     except IOError as e:
         st.error(f"Error saving expenses: {e}")
 
 
+def append_expense(expense):
+    """Append one expense to the JSON array in place instead of rewriting the whole file."""
+    if not os.path.exists(DATA_FILE) or os.path.getsize(DATA_FILE) == 0:
+        save_expenses([expense])
+        return
+
+    entry = dump_json_bytes(expense).decode('utf-8')
+    # Match the layout save_expenses writes: one level of indentation inside the array
+    entry = '\n'.join(' ' * JSON_INDENT + line for line in entry.splitlines())
+
+    try:
+        with open(DATA_FILE, 'rb+') as file:
+            file.seek(0, os.SEEK_END)
+            tail_start = max(0, file.tell() - 4096)
+            file.seek(tail_start)
+            tail = file.read().rstrip()
+            if not tail.endswith(b']'):
+                raise ValueError("expense file is not a JSON array")
+            body = tail[:-1].rstrip()
+            separator = '\n' if body.endswith(b'[') else ',\n'
+            file.seek(tail_start + len(body))
+            file.truncate()
+            file.write((separator + entry + '\n]').encode('utf-8'))
+    except JSON_DECODE_ERRORS + (IOError,):
+        # Unexpected layout: fall back to a full rewrite
+        save_expenses(load_expenses() + [expense])
+        return
+
+    st.success("✓ Expenses saved successfully!")
+    load_expenses_df.clear()
+
+
 def convert_to_dataframe(expenses):
     """Convert expenses list to pandas DataFrame."""
     if not expenses:
         return pd.DataFrame()
     
     df = pd.DataFrame(expenses)
-    df['date'] = pd.to_datetime(df['date'])
+    if 'date_ordinal' in df and df['date_ordinal'].notna().all():
+        # Stored day numbers convert arithmetically; no date strings are parsed
+        dates = pd.to_datetime(df['date_ordinal'].astype(np.int64), unit='D')
+    else:
+        # Some dates are not YYYY-MM-DD (e.g. edited by hand), so parse each one on its own;
+        # cache=True parses each distinct date string only once
+        dates = pd.to_datetime(df['date'], format='mixed', cache=True)
+    extra = sorted(set(df['category'].unique()) - set(CATEGORIES))
+    # All derived columns are set in one assign; the cached frame is never mutated afterwards
+    df = df.assign(
+        date=dates,
+        # Kept as float64: float32 would lose paise on amounts above about ₹131k
+        amount=df['amount'].astype(np.float64),
+        # Categorical codes make groupby/isin work on small ints instead of Python strings
+        category=df['category'].astype(pd.CategoricalDtype(CATEGORIES + extra)),
+        # Formatted once per dataset for the manage and details tables
+        date_str=dates.dt.strftime('%Y-%m-%d')
+    )
     return df.sort_values('date', ascending=False)
 
 
+def read_feather_cache(source_key):
+    """Return the Feather-cached DataFrame if it was built from this DATA_FILE version, else None."""
+    try:
+        table = feather.read_table(FEATHER_CACHE_FILE)
+    except Exception:
+        return None
+    metadata = table.schema.metadata or {}
+    if metadata.get(b'source_key') != json.dumps(source_key).encode():
+        return None
+    return table.to_pandas()
+
+
+def write_feather_cache(df, source_key):
+    """Persist the converted DataFrame with the DATA_FILE key it was built from."""
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'source_key'] = json.dumps(source_key).encode()
+        feather.write_feather(table.replace_schema_metadata(metadata), FEATHER_CACHE_FILE)
+    except Exception:
+        pass
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_expenses_df(source_key):
+    """Read and convert DATA_FILE in one cached step, keyed on its (mtime_ns, size).
+
+    With pyarrow installed, a Feather copy skips JSON parsing and date conversion
+    across app restarts until DATA_FILE changes.
+    """
+    if source_key is None:
+        return pd.DataFrame()
+    if FEATHER_AVAILABLE:
+        df = read_feather_cache(source_key)
+        if df is not None:
+            return df
+    df = convert_to_dataframe(load_expenses())
+    if FEATHER_AVAILABLE and not df.empty:
+        write_feather_cache(df, source_key)
+    return df
+
+
+def get_df():
+    """DataFrame of all expenses for the current version of DATA_FILE."""
+    return load_expenses_df(data_file_key())
+
+
+def group_sum(codes, values, ngroups):
+    """Sum values per integer group code in a single pass."""
+    out = np.zeros(ngroups)
+    for i in range(codes.size):
+        out[codes[i]] += values[i]
+    return out
+
+
+if NUMBA_AVAILABLE:
+    group_sum = njit(cache=True)(group_sum)
+
+
+def period_labels(keys, freq):
+    """Format integer period keys from time_rollup as pandas-style period strings."""
+    if freq == 'D':
+        return np.datetime_as_string(keys.astype('datetime64[D]'))
+    if freq == 'W':
+        starts = (keys * 7 - 3).astype('datetime64[D]')
+        return [f"{s}/{e}" for s, e in zip(np.datetime_as_string(starts), np.datetime_as_string(starts + 6))]
+    if freq == 'M':
+        return np.datetime_as_string(keys.astype('datetime64[M]'))
+    if freq == 'Q':
+        return [f"{1970 + k // 4}Q{k % 4 + 1}" for k in keys.tolist()]
+    return [str(1970 + k) for k in keys.tolist()]
+
+
+def time_rollup(dates, amounts, freq):
+    """Total/Count/Average/Min/Max of amounts per period, for date-ascending arrays.
+
+    Periods are integer keys derived from the datetime64 values, so each group is a
+    contiguous run reduced with ufunc.reduceat; no PeriodArray or hash groupby is built.
+    """
+    if freq == 'D':
+        keys = dates.astype('datetime64[D]').astype(np.int64)
+    elif freq == 'W':
+        # Monday-start weeks; 1970-01-01 was a Thursday
+        keys = (dates.astype('datetime64[D]').astype(np.int64) + 3) // 7
+    elif freq == 'M':
+        keys = dates.astype('datetime64[M]').astype(np.int64)
+    elif freq == 'Q':
+        keys = dates.astype('datetime64[M]').astype(np.int64) // 3
+    else:
+        keys = dates.astype('datetime64[Y]').astype(np.int64)
+
+    uniq, first_idx = np.unique(keys, return_index=True)
+    totals = np.add.reduceat(amounts, first_idx)
+    counts = np.diff(np.append(first_idx, len(keys)))
+    grouped = pd.DataFrame({
+        'period': period_labels(uniq, freq),
+        'Total': totals,
+        'Count': counts,
+        'Average': totals / counts,
+        'Min': np.minimum.reduceat(amounts, first_idx),
+        'Max': np.maximum.reduceat(amounts, first_idx)
+    })
+    # Min/Max stay exact stored amounts (the details page uses them as slider bounds)
+    return grouped.round({'Total': 2, 'Average': 2})
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def build_aggregates(source_key):
+    """Precompute category and time-period rollups once per data change."""
+    df = load_expenses_df(source_key)
+    if df.empty:
+        return {}
+
+    if NUMBA_AVAILABLE and len(df) > NUMBA_MIN_ROWS:
+        codes, uniques = pd.factorize(df['category'])
+        totals = group_sum(codes, df['amount'].to_numpy(), len(uniques))
+        counts = np.bincount(codes, minlength=len(uniques))
+        by_category = pd.DataFrame(
+            {'Total': totals, 'Count': counts, 'Average': totals / counts},
+            index=pd.Index(uniques, name='category')
+        ).round(2)
+    else:
+        by_category = df.groupby('category', observed=True, sort=False)['amount'].agg(['sum', 'count', 'mean']).round(2)
+        by_category.columns = ['Total', 'Count', 'Average']
+    aggregates = {'by_category': by_category.sort_values('Total', ascending=False)}
+
+    # df is sorted newest-first; reverse once so every period is a contiguous ascending run
+    dates = df['date'].to_numpy(dtype='datetime64[ns]')[::-1]
+    amounts = df['amount'].to_numpy()[::-1]
+    for option, freq in PERIOD_FREQS.items():
+        aggregates[option] = time_rollup(dates, amounts, freq)
+    return aggregates
+
+
 def apply_custom_chart_style(fig, height=420):
-    """Apply consistent styling to plotly charts."""
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font={'family': 'Poppins, Inter, sans-serif', 'color': '#0f172a', 'size': 13},
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=13,
-            font_family="Inter"
-        ),
-        margin=dict(l=40, r=20, t=60, b=40),
-        transition=dict(duration=800, easing='cubic-in-out'),
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
-    )
-    fig.update_traces(marker=dict(line=dict(width=0)))
+    """Set the chart height; the rest of the style comes from the 'expense' template."""
     fig.update_layout(height=height)
     return fig
 
@@ -164,19 +500,10 @@ def parse_amount_from_text(text):
     """Try to extract a numeric amount from arbitrary text."""
     if not text:
         return None
-    # Common currency patterns: ₹, Rs, plain numbers; pick the largest plausible number
-    matches = re.findall(r'₹\s?[\d,]+(?:\.\d{1,2})?|Rs\.?\s?[\d,]+(?:\.\d{1,2})?|\b[0-9][0-9,]*\.?[0-9]{0,2}\b', text)
-    nums = []
-    for m in matches:
-        m_clean = re.sub(r'[₹,Rs\.\s]', '', m)
-        try:
-            nums.append(float(m_clean))
-        except Exception:
-            continue
-    if not nums:
-        return None
+    # Common currency patterns: ₹, Rs, plain numbers; both groups start with a digit
+    nums = [float((m.group(1) or m.group(2)).replace(',', '')) for m in AMOUNT_RE.finditer(text)]
     # Return the largest numeric-looking match (works well for receipts with totals)
-    return max(nums)
+    return max(nums, default=None)
 
 
 def parse_date_from_text(text):
@@ -190,12 +517,26 @@ def parse_date_from_text(text):
         return None
 
 
+def get_tess_api():
+    """Per-session tesserocr handle, so Tesseract is initialised once instead of per upload."""
+    if 'tess_api' not in st.session_state:
+        st.session_state['tess_api'] = tesserocr.PyTessBaseAPI()
+    return st.session_state['tess_api']
+
+
 def ocr_extract_text(uploaded_file):
-    """Use pytesseract to extract text from an uploaded image file-like object."""
+    """Extract text from an uploaded image file-like object (tesserocr, else pytesseract)."""
     if not OCR_AVAILABLE:
         return ""
     try:
-        img = Image.open(uploaded_file)
+        # Grayscale + downscale: Tesseract time grows with pixel count, and phone photos are huge
+        img = Image.open(uploaded_file).convert('L')
+        img.thumbnail((OCR_MAX_DIM, OCR_MAX_DIM), Image.LANCZOS)
+        img = ImageOps.autocontrast(img)
+        if TESSEROCR_AVAILABLE:
+            api = get_tess_api()
+            api.SetImage(img)
+            return api.GetUTF8Text()
         text = pytesseract.image_to_string(img)
         return text
     except Exception as e:
@@ -203,30 +544,34 @@ def ocr_extract_text(uploaded_file):
         return ""
 
 
-def auto_categorize(description, expenses_list=None):
+@st.cache_data(show_spinner=False, max_entries=2)
+def historical_category_index(source_key):
+    """Map each lowercased word seen in past descriptions to its most frequent category."""
+    df = load_expenses_df(source_key)
+    if df.empty:
+        return {}
+    words = pd.DataFrame({
+        'token': df['description'].str.lower().str.split(),
+        'category': df['category'].astype(str)
+    }).explode('token').dropna()
+    # value_counts sorts by frequency, so the first row per token is its most common category
+    counts = words.value_counts(['token', 'category']).reset_index()
+    return counts.drop_duplicates('token').set_index('token')['category'].to_dict()
+
+
+def auto_categorize(description, use_history=True):
     """Simple heuristic categorizer: keyword matching + historical lookup."""
     desc = (description or "").lower()
-    keywords = {
-        'Food': ['restaurant','cafe','grocery','supermarket','zomato','swiggy','dine','meal'],
-        'Transport': ['uber','ola','taxi','bus','metro','petrol','fuel','auto','parking'],
-        'Entertainment': ['netflix','movie','ticket','spotify','concert','streaming'],
-        'Shopping': ['flipkart','amazon','mall','shopping','store','clothing','shoes'],
-        'Bills': ['electricity','internet','bill','water','subscription','rent','emi'],
-        'Health': ['doctor','hospital','pharmacy','clinic','medicine'],
-        'Education': ['course','college','tuition','books','class'],
-    }
-    for cat, kws in keywords.items():
-        for kw in kws:
-            if kw in desc:
-                return cat
-    # Fallback: historical simple matching by token
-    if expenses_list:
+    match = CATEGORY_RE.search(desc)
+    if match:
+        return match.lastgroup
+    # Fallback: historical lookup by token; the index is only built when first needed
+    if use_history:
         try:
-            hist_df = convert_to_dataframe(expenses_list)
+            history = historical_category_index(data_file_key())
             for token in desc.split():
-                matches = hist_df[hist_df['description'].str.lower().str.contains(token, na=False)]
-                if not matches.empty:
-                    return matches['category'].mode().iloc[0]
+                if token in history:
+                    return history[token]
         except Exception:
             pass
     return 'Other'
@@ -335,7 +680,7 @@ def inject_theme_css(theme='Dark'):
 
 # ==================== Dashboard Components ====================
 
-def dashboard():
+def dashboard(expenses):
     """Main dashboard view."""
     st.markdown("""
     <div style="display:flex;align-items:center;gap:18px;margin-bottom:10px;">
@@ -349,23 +694,20 @@ def dashboard():
     </div>
     """, unsafe_allow_html=True)
 
-    
-    expenses = load_expenses()
-    
     if not expenses:
         st.info("📊 No expenses yet. Add your first expense to get started!")
         return
     
-    df = convert_to_dataframe(expenses)
+    df = get_df()
     
     # Key Metrics
     st.markdown("<div class='section-header'><span>📈</span> Overview</div>", unsafe_allow_html=True)
     col1, col2, col3, col4 = st.columns(4)
     
     total = df['amount'].sum()
-    avg = df['amount'].mean()
-    max_exp = df['amount'].max()
     count = len(df)
+    avg = total / count
+    max_exp = df['amount'].max()
     
     with col1:
         st.metric("Total Spending", f"₹{total:,.2f}")
@@ -380,65 +722,199 @@ def dashboard():
     st.markdown("<div class='section-header'><span>📊</span> Analytics</div>", unsafe_allow_html=True)
     
     tab1, tab2, tab3, tab4 = st.tabs(["Category Breakdown", "Trends", "Time Analysis", "Details"])
+    aggregates = build_aggregates(data_file_key())
     
     with tab1:
-        category_summary(df)
+        category_summary(aggregates)
     
     with tab2:
-        spending_trends(df)
+        spending_trends(aggregates)
     
     with tab3:
-        time_analysis(df)
+        time_analysis(aggregates)
     
     with tab4:
-        detailed_expenses(df)
+        detailed_expenses(df, aggregates)
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def make_csv_bytes(source_key):
+    """CSV export of all expenses, serialized once per data change."""
+    buf = io.BytesIO()
+    load_expenses_df(source_key).drop(columns=['date_str', 'date_ordinal'], errors='ignore').to_csv(buf, index=False)
+    return buf.getvalue()
+
 
+def totals_key(frame, label_col, value_col='Total'):
+    """Immutable (label, value) pairs used as a figure cache key."""
+    return tuple(zip(frame[label_col].astype(str), frame[value_col].tolist()))
 
-def category_summary(df):
+
+@st.cache_resource(max_entries=2)
+def build_category_pie(category_totals):
+    """Donut chart of spending share per category."""
+    labels, values = zip(*category_totals)
+    fig = px.pie(
+        names=list(labels),
+        values=list(values),
+        title="Expense Distribution",
+        color_discrete_sequence=CHART_COLORS,
+        hole=0.4
+    )
+    fig.update_traces(
+        textposition='outside', 
+        textinfo='percent+label',
+        pull=[0.06] * len(labels),
+        marker=dict(line=dict(color='rgba(255,255,255,0.08)', width=2))
+    )
+    apply_custom_chart_style(fig)
+    return fig
+
+
+@st.cache_resource(max_entries=2)
+def build_category_bar(category_totals):
+    """Bar chart of total spending per category."""
+    labels, values = zip(*category_totals)
+    fig = px.bar(
+        x=list(labels),
+        y=list(values),
+        title="Total Spending by Category",
+        color=list(labels),
+        color_discrete_sequence=CHART_COLORS,
+        labels={'y': 'Amount (₹)', 'x': 'Category'}
+    )
+    apply_custom_chart_style(fig)
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+@st.cache_resource(max_entries=2)
+def build_distribution_pie(source_key):
+    """Donut chart of transaction counts per amount percentile band, built once per data change."""
+    amounts = load_expenses_df(source_key)['amount'].to_numpy()
+    percentiles = np.quantile(amounts, [0.25, 0.5, 0.75, 0.9])
+    # One unsorted pass: bucket i holds amounts in (percentiles[i-1], percentiles[i]]
+    counts = np.bincount(np.digitize(amounts, percentiles, right=True), minlength=5)
+    dist_data = pd.DataFrame({
+        'Range': ['Budget (0-25%)', 'Normal (25-50%)', 'Moderate (50-75%)', 'High (75-90%)', 'Premium (90%+)'],
+        'Count': counts
+    })
+    
+    fig = px.pie(
+        dist_data,
+        values='Count',
+        names='Range',
+        title="Transaction Value Distribution",
+        color_discrete_sequence=CHART_COLORS,
+        hole=0.4
+    )
+    apply_custom_chart_style(fig)
+    return fig
+
+
+@st.cache_resource(max_entries=2)
+def build_cumulative_chart(daily_totals):
+    """Cumulative spending area chart with a range slider; WebGL for long histories."""
+    daily_spending = pd.DataFrame(list(daily_totals), columns=['Date', 'Amount'])
+    daily_spending['Cumulative'] = daily_spending['Amount'].cumsum()
+
+    if len(daily_spending) > WEBGL_POINT_THRESHOLD:
+        # Long histories render as a WebGL trace; small ones keep the SVG area chart
+        fig = go.Figure(go.Scattergl(
+            x=daily_spending['Date'],
+            y=daily_spending['Cumulative'],
+            mode='lines',
+            fill='tozeroy',
+            line=dict(color=CHART_COLORS[0], width=3)
+        ))
+        fig.update_layout(title='Cumulative Spending Over Time', xaxis_title='Date', yaxis_title='Cumulative')
+    else:
+        fig = px.area(
+            daily_spending,
+            x='Date',
+            y='Cumulative',
+            title='Cumulative Spending Over Time',
+            color_discrete_sequence=[CHART_COLORS[0]]
+        )
+        fig.update_traces(line=dict(width=3), marker=dict(size=6))
+    # A range slider replaces the per-date animation frames (which grew quadratically)
+    fig.update_xaxes(rangeslider_visible=True)
+    apply_custom_chart_style(fig, height=480)
+    return fig
+
+
+@st.cache_resource(max_entries=4)
+def build_period_bar(period_totals, title, xaxis_title, color):
+    """Single-colour bar chart of totals per period (weekly/monthly aggregates)."""
+    labels, values = zip(*period_totals)
+    if len(labels) > WEBGL_POINT_THRESHOLD:
+        # Plotly has no WebGL bar trace; long series become a filled Scattergl line
+        fig = go.Figure(go.Scattergl(
+            x=list(labels),
+            y=list(values),
+            mode='lines',
+            fill='tozeroy',
+            line=dict(color=color)
+        ))
+        fig.update_layout(title=title)
+    else:
+        fig = px.bar(
+            x=list(labels),
+            y=list(values),
+            title=title,
+            color_discrete_sequence=[color]
+        )
+    fig.update_layout(xaxis_title=xaxis_title, yaxis_title='Amount (₹)')
+    apply_custom_chart_style(fig, height=380)
+    return fig
+
+
+@st.cache_resource(max_entries=10)
+def build_time_chart(period_totals, time_option, period_name):
+    """Period breakdown chart for time_analysis."""
+    labels, values = zip(*period_totals)
+    if len(labels) > WEBGL_POINT_THRESHOLD:
+        # Plotly has no WebGL bar trace; draw long series as a Scattergl line instead
+        fig = go.Figure(go.Scattergl(
+            x=list(labels),
+            y=list(values),
+            mode='lines+markers',
+            line=dict(color=CHART_COLORS[0])
+        ))
+        fig.update_layout(
+            title=f"Spending Breakdown: {time_option}",
+            xaxis_title=period_name,
+            yaxis_title='Amount (₹)'
+        )
+    else:
+        fig = px.bar(
+            x=list(labels),
+            y=list(values),
+            title=f"Spending Breakdown: {time_option}",
+            color=list(values),
+            color_continuous_scale='Viridis',
+            labels={'x': period_name, 'y': 'Amount (₹)', 'color': 'Amount (₹)'}
+        )
+    apply_custom_chart_style(fig)
+    return fig
+
+
+def category_summary(aggregates):
     """Display category-wise spending breakdown."""
     
     col1, col2 = st.columns(2)
     
-    # Category totals
-    category_data = df.groupby('category').agg({
-        'amount': ['sum', 'count', 'mean']
-    }).round(2)
-    category_data.columns = ['Total', 'Count', 'Average']
-    category_data = category_data.sort_values('Total', ascending=False)
+    # Category totals (precomputed, already sorted by Total)
+    category_data = aggregates['by_category']
+    category_totals = totals_key(category_data.reset_index(), 'category')
     
     with col1:
         # Pie Chart
-        fig_pie = px.pie(
-            df,
-            values='amount',
-            names='category',
-            title="Expense Distribution",
-            color_discrete_sequence=CHART_COLORS,
-            hole=0.4
-        )
-        fig_pie.update_traces(
-            textposition='outside', 
-            textinfo='percent+label',
-            pull=[0.06] * len(df['category'].unique()),
-            marker=dict(line=dict(color='rgba(255,255,255,0.08)', width=2))
-        )
-        apply_custom_chart_style(fig_pie)
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(build_category_pie(category_totals), use_container_width=True)
     
     with col2:
         # Bar Chart
-        fig_bar = px.bar(
-            category_data.reset_index(),
-            x='category',
-            y='Total',
-            title="Total Spending by Category",
-            color='category',
-            color_discrete_sequence=CHART_COLORS,
-            labels={'Total': 'Amount (₹)', 'category': 'Category'}
-        )
-        apply_custom_chart_style(fig_bar)
-        fig_bar.update_layout(showlegend=False)
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(build_category_bar(category_totals), use_container_width=True)
     
     # Detailed table
     st.markdown("#### Category Statistics")
@@ -454,150 +930,85 @@ def category_summary(df):
     )
 
 
-def spending_trends(df):
-    """Display spending trends over time with an animated cumulative chart."""
+def spending_trends(aggregates):
+    """Display spending trends over time with a cumulative chart."""
     st.markdown("<div class='section-header'><span>📉</span> Spending Trends</div>", unsafe_allow_html=True)
 
-    # Daily spending trend and cumulative animation
-    daily_spending = df.groupby(df['date'].dt.date)['amount'].sum().reset_index()
-    daily_spending.columns = ['Date', 'Amount']
-    daily_spending = daily_spending.sort_values('Date')
-    daily_spending['Cumulative'] = daily_spending['Amount'].cumsum()
-
-    # Build animation frames: for each frame show cumulative up to that date
-    frames = []
-    for frame_date in daily_spending['Date'].unique():
-        subset = daily_spending[daily_spending['Date'] <= frame_date].copy()
-        subset['Frame'] = frame_date
-        frames.append(subset)
-    anim_df = pd.concat(frames)
-
-    fig_anim = px.area(
-        anim_df,
-        x='Date',
-        y='Cumulative',
-        animation_frame='Frame',
-        title='Cumulative Spending Over Time',
-        color_discrete_sequence=[CHART_COLORS[0]]
-    )
-    fig_anim.update_traces(line=dict(width=3), marker=dict(size=6))
-    apply_custom_chart_style(fig_anim, height=480)
-    # Show plotly animation controls with a comfortable size
-    st.plotly_chart(fig_anim, use_container_width=True, height=480)
+    # Daily spending trend as a running total
+    fig_cumulative = build_cumulative_chart(totals_key(aggregates['Daily'], 'period'))
+    st.plotly_chart(fig_cumulative, use_container_width=True, height=480)
 
     # Weekly/Monthly comparison (cleaner colors & sizes)
     col1, col2 = st.columns(2)
 
     with col1:
-        df['week'] = df['date'].dt.to_period('W')
-        weekly = df.groupby('week')['amount'].sum().reset_index()
-        weekly['week'] = weekly['week'].astype(str)
-
-        fig_weekly = px.bar(
-            weekly,
-            x='week',
-            y='amount',
-            title='Weekly Aggregates',
-            color_discrete_sequence=[CHART_COLORS[1]]
+        fig_weekly = build_period_bar(
+            totals_key(aggregates['Weekly'], 'period'), 'Weekly Aggregates', 'Week', CHART_COLORS[1]
         )
-        fig_weekly.update_layout(xaxis_title='Week', yaxis_title='Amount (₹)')
-        apply_custom_chart_style(fig_weekly, height=380)
         st.plotly_chart(fig_weekly, use_container_width=True)
 
     with col2:
-        df['month'] = df['date'].dt.to_period('M')
-        monthly = df.groupby('month')['amount'].sum().reset_index()
-        monthly['month'] = monthly['month'].astype(str)
-
-        fig_monthly = px.bar(
-            monthly,
-            x='month',
-            y='amount',
-            title='Monthly Aggregates',
-            color_discrete_sequence=[CHART_COLORS[2]]
+        fig_monthly = build_period_bar(
+            totals_key(aggregates['Monthly'], 'period'), 'Monthly Aggregates', 'Month', CHART_COLORS[2]
         )
-        fig_monthly.update_layout(xaxis_title='Month', yaxis_title='Amount (₹)')
-        apply_custom_chart_style(fig_monthly, height=380)
         st.plotly_chart(fig_monthly, use_container_width=True)
 
 
-def time_analysis(df):
+def time_analysis(aggregates):
     """Analyze expenses by time periods."""
     st.markdown("<div class='section-header'><span>📅</span> Period Analysis</div>", unsafe_allow_html=True)
     
     # Time period selector
     time_option = st.radio(
         "Select Time Period",
-        ["Daily", "Weekly", "Monthly", "Quarterly", "Yearly"],
+        list(PERIOD_FREQS),
         horizontal=True
     )
+    period_name = {
+        "Daily": "Date", "Weekly": "Week", "Monthly": "Month", "Quarterly": "Quarter", "Yearly": "Year"
+    }[time_option]
     
-    if time_option == "Daily":
-        time_period = df['date'].dt.date
-        period_name = "Date"
-    elif time_option == "Weekly":
-        time_period = df['date'].dt.to_period('W')
-        period_name = "Week"
-    elif time_option == "Monthly":
-        time_period = df['date'].dt.to_period('M')
-        period_name = "Month"
-    elif time_option == "Quarterly":
-        time_period = df['date'].dt.to_period('Q')
-        period_name = "Quarter"
-    else:
-        time_period = df['date'].dt.to_period('Y')
-        period_name = "Year"
-    
-    # Group data
-    time_data = df.copy()
-    time_data['period'] = time_period.astype(str)
-    grouped = time_data.groupby('period').agg({
-        'amount': ['sum', 'count', 'mean', 'min', 'max']
-    }).round(2)
-    grouped.columns = ['Total', 'Count', 'Average', 'Min', 'Max']
+    # Grouped data is precomputed per period in build_aggregates
+    grouped = aggregates[time_option].rename(columns={'period': period_name})
     
     # Visualization
-    fig = px.bar(
-        grouped.reset_index().rename(columns={'period': period_name}),
-        x=period_name,
-        y='Total',
-        title=f"Spending Breakdown: {time_option}",
-        color='Total',
-        color_continuous_scale='Viridis',
-        labels={'Total': 'Amount (₹)'}
-    )
-    apply_custom_chart_style(fig)
+    fig = build_time_chart(totals_key(grouped, period_name), time_option, period_name)
     st.plotly_chart(fig, use_container_width=True)
 
     # Display table
     st.markdown("#### Period Statistics")
-    st.dataframe(grouped.reset_index().rename(columns={'period': period_name}), use_container_width=True, hide_index=True)
+    st.dataframe(grouped, use_container_width=True, hide_index=True)
 
 
-def detailed_expenses(df):
+def detailed_expenses(df, aggregates):
     """Display detailed expense table."""
     st.markdown("<div class='section-header'><span>📋</span> Expense Details</div>", unsafe_allow_html=True)
     
+    # Filter bounds come from the cached rollups instead of rescanning df columns
+    categories = list(aggregates['by_category'].index)
+    yearly = aggregates['Yearly']
+    
     # Filters
     col1, col2, col3 = st.columns(3)
     
     with col1:
         category_filter = st.multiselect(
             "Filter by Category",
-            df['category'].unique(),
-            default=df['category'].unique()
+            categories,
+            default=categories
         )
     
     with col2:
         date_range = st.date_input(
             "Date Range",
-            value=(df['date'].min().date(), df['date'].max().date()),
+            # df is sorted newest-first, so the bounds are the last and first rows
+            value=(df['date'].iloc[-1].date(), df['date'].iloc[0].date()),
             max_value=datetime.now().date()
         )
     
     with col3:
-        min_amt = float(df['amount'].min())
-        max_amt = float(df['amount'].max())
+        min_amt = float(yearly['Min'].min())
+        max_amt = float(yearly['Max'].max())
         
         # Handle cases where min and max are the same
         if min_amt == max_amt:
@@ -612,38 +1023,55 @@ def detailed_expenses(df):
                 step=10.0
             )
     
-    # Apply filters
-    filtered_df = df[
-        (df['category'].isin(category_filter)) &
-        (df['date'].dt.date >= date_range[0]) &
-        (df['date'].dt.date <= date_range[1]) &
-        (df['amount'] >= amount_range[0]) &
-        (df['amount'] <= amount_range[1])
-    ].copy()
+    # Date window by binary search: df is sorted newest-first, so search its reversed (ascending) view
+    dates = df['date'].to_numpy()
+    lo = np.datetime64(date_range[0]).astype(dates.dtype)
+    hi = (np.datetime64(date_range[1]) + np.timedelta64(1, 'D')).astype(dates.dtype)
+    n = len(dates)
+    start = n - np.searchsorted(dates[::-1], hi, side='left')
+    stop = n - np.searchsorted(dates[::-1], lo, side='left')
+    window = df.iloc[start:stop]
     
-    # Display table
-    display_df = filtered_df[[
-        'date', 'category', 'amount', 'description'
-    ]].copy()
-    display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d')
-    display_df.columns = ['Date', 'Category', 'Amount (₹)', 'Description']
+    # Remaining filters only scan the date window; categorical isin compares integer codes
+    amt = window['amount'].to_numpy()
+    cat = window['category']
+    mask = (
+        (amt >= amount_range[0]) & (amt <= amount_range[1]) &
+        cat.isin(category_filter).to_numpy()
+    )
+    filtered_amt = amt[mask]
+    
+    # Display table, built straight from the masked column arrays
+    display_df = pd.DataFrame({
+        'Date': window['date_str'].to_numpy()[mask],
+        'Category': cat.to_numpy()[mask],
+        'Amount (₹)': filtered_amt,
+        'Description': window['description'].to_numpy()[mask]
+    })
     
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    if AGGRID_AVAILABLE:
+        # Paginated grid: the browser only renders one page of rows at a time
+        gb = GridOptionsBuilder.from_dataframe(display_df)
+        gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=50)
+        gb.configure_default_column(filterable=True, sortable=True)
+        AgGrid(display_df, gridOptions=gb.build(), enable_enterprise_modules=False)
+    else:
+        st.dataframe(display_df, use_container_width=True, hide_index=True)
     
     # Summary
     st.markdown("#### Filtered Summary")
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total", f"₹{filtered_df['amount'].sum():,.2f}")
+        st.metric("Total", f"₹{filtered_amt.sum():,.2f}")
     with col2:
-        st.metric("Count", len(filtered_df))
+        st.metric("Count", len(filtered_amt))
     with col3:
-        st.metric("Average", f"₹{filtered_df['amount'].mean():,.2f}")
+        st.metric("Average", f"₹{filtered_amt.mean() if len(filtered_amt) else 0:,.2f}")
 
 
 # ==================== Add/Manage Expenses ====================
 
-def add_expense_page():
+def add_expense_page(expenses):
     """Page to add new expenses with optional OCR receipt upload and AI auto-categorization."""
     st.markdown("<div class='section-header'><span>➕</span> Add New Expense</div>", unsafe_allow_html=True)
     
@@ -671,7 +1099,7 @@ def add_expense_page():
                 value=pre_date if pre_date else datetime.now().date()
             )
         
-        categories = ["Food", "Transport", "Entertainment", "Shopping", "Bills", "Health", "Education", "Other"]
+        categories = CATEGORIES
         default_cat = pre_category if pre_category in categories else categories[0]
         category = st.selectbox(
             "Category",
@@ -698,7 +1126,7 @@ def add_expense_page():
                     parsed_desc = text.strip().replace('\n', ' ')[:400]
                     parsed_category = None
                     if st.session_state.get('ai_enabled', True):
-                        parsed_category = auto_categorize(parsed_desc, load_expenses())
+                        parsed_category = auto_categorize(parsed_desc)
                     if parsed_amount:
                         st.session_state['ocr_amount'] = parsed_amount
                     if parsed_date:
@@ -714,7 +1142,7 @@ def add_expense_page():
         # Suggest category using AI
         if st.session_state.get('ai_enabled', True):
             if st.button("🔍 Suggest Category", key='suggest_cat'):
-                suggested = auto_categorize(description, load_expenses())
+                suggested = auto_categorize(description)
                 st.info(f"Suggested Category: **{suggested}**")
 
         # Save
@@ -722,21 +1150,20 @@ def add_expense_page():
             if amount > 0:
                 # If AI enabled and category is 'Other', attempt auto-categorize
                 if st.session_state.get('ai_enabled', True) and (not category or category == 'Other'):
-                    suggested = auto_categorize(description, load_expenses())
+                    suggested = auto_categorize(description)
                     if suggested and suggested != 'Other':
                         category = suggested
                         st.info(f"Auto-categorized as {category}")
 
-                expenses = load_expenses()
                 new_expense = {
                     "amount": float(amount),
                     "category": category,
                     "date": str(date),
+                    "date_ordinal": date_ordinal(str(date)),
                     "description": description or "No description",
                     "timestamp": datetime.now().isoformat()
                 }
-                expenses.append(new_expense)
-                save_expenses(expenses)
+                append_expense(new_expense)
                 # Clear OCR session prefills after successful save
                 for k in ['ocr_amount','ocr_date','ocr_category','ocr_description']:
                     if k in st.session_state:
@@ -748,59 +1175,62 @@ def add_expense_page():
         st.markdown("</div>", unsafe_allow_html=True)
 
 
-def manage_expenses_page():
+def manage_expenses_page(expenses):
     """Page to edit/delete expenses."""
     st.markdown("<div class='section-header'><span>✏️</span> Manage Expenses</div>", unsafe_allow_html=True)
     
-    expenses = load_expenses()
-    
     if not expenses:
         st.info("No expenses to manage")
         return
     
-    df = convert_to_dataframe(expenses)
+    df = get_df()
     
     # Create editable dataframe
     st.markdown("#### Edit or Delete Expenses")
     
-    # Display with options to delete
-    for idx, (i, row) in enumerate(df.iterrows()):
-        with st.container():
-            col1, col2, col3, col4, col5 = st.columns([2, 2, 2, 3, 1])
-            
-            with col1:
-                st.markdown(f"**📅 {row['date'].strftime('%Y-%m-%d')}**")
-            with col2:
-                st.write(f"₹{row['amount']:.2f}")
-            with col3:
-                st.write(f"🏷️ {row['category']}")
-            with col4:
-                st.write(f"📝 {row['description']}")
-            with col5:
-                if st.button("🗑️", key=f"del_{idx}"):
-                    expenses.pop(i)
-                    save_expenses(expenses)
-                    st.rerun()
-            st.markdown("---")
+    # A single editor widget for all rows; df index maps back to positions in expenses
+    display_df = pd.DataFrame({
+        'Date': df['date_str'],
+        'Amount (₹)': df['amount'],
+        'Category': df['category'],
+        'Description': df['description'],
+        'Delete': False
+    })
+    edited = st.data_editor(
+        display_df,
+        num_rows="fixed",
+        use_container_width=True,
+        hide_index=True,
+        disabled=['Date', 'Amount (₹)', 'Category', 'Description'],
+        column_config={"Delete": st.column_config.CheckboxColumn("🗑️ Delete")},
+        key="manage_editor"
+    )
+    
+    if st.button("🗑️ Delete Selected", key="apply_delete"):
+        indices_to_drop = set(edited.index[edited['Delete']])
+        if indices_to_drop:
+            expenses = [exp for i, exp in enumerate(expenses) if i not in indices_to_drop]
+            save_expenses(expenses)
+            st.rerun()
+        else:
+            st.info("Select at least one expense to delete")
 
 
-def statistics_page():
+def statistics_page(expenses):
     """Advanced statistics and analytics."""
     st.markdown("<div class='section-header'><span>📊</span> Advanced Analytics</div>", unsafe_allow_html=True)
     
-    expenses = load_expenses()
-    
     if not expenses:
         st.info("No data available for statistics")
         return
     
-    df = convert_to_dataframe(expenses)
+    df = get_df()
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Top spending categories
-        top_categories = df.groupby('category')['amount'].sum().nlargest(5)
+        top_categories = df.groupby('category', observed=True, sort=False)['amount'].sum().nlargest(5)
         fig = px.bar(
             x=top_categories.index,
             y=top_categories.values,
@@ -815,39 +1245,31 @@ def statistics_page():
     
     with col2:
         # Spending distribution
-        percentiles = df['amount'].quantile([0.25, 0.5, 0.75, 0.9])
-        dist_data = pd.DataFrame({
-            'Range': ['Budget (0-25%)', 'Normal (25-50%)', 'Moderate (50-75%)', 'High (75-90%)', 'Premium (90%+)'],
-            'Count': [
-                len(df[df['amount'] <= percentiles[0.25]]),
-                len(df[(df['amount'] > percentiles[0.25]) & (df['amount'] <= percentiles[0.5])]),
-                len(df[(df['amount'] > percentiles[0.5]) & (df['amount'] <= percentiles[0.75])]),
-                len(df[(df['amount'] > percentiles[0.75]) & (df['amount'] <= percentiles[0.9])]),
-                len(df[df['amount'] > percentiles[0.9]])
-            ]
-        })
-        
-        fig = px.pie(
-            dist_data,
-            values='Count',
-            names='Range',
-            title="Transaction Value Distribution",
-            color_discrete_sequence=CHART_COLORS,
-            hole=0.4
-        )
-        apply_custom_chart_style(fig)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_distribution_pie(data_file_key()), use_container_width=True)
     
     # Category analysis
     st.markdown("#### Deep Dive: Category Analysis")
-    category_analysis = df.groupby('category').agg({
-        'amount': ['sum', 'count', 'mean', 'min', 'max', 'std']
-    }).round(2)
-    category_analysis.columns = ['Total Spend', 'Transactions', 'Average', 'Minimum', 'Maximum', 'Std Dev']
+    grouped = df.groupby('category', observed=True, sort=False)['amount']
+    if NUMBA_AVAILABLE and len(df) > NUMBA_MIN_ROWS:
+        # pandas' Numba engine runs each reduction as a JIT-compiled, parallel kernel (GIL released)
+        engine = {'engine': 'numba', 'engine_kwargs': {'nopython': True, 'nogil': True, 'parallel': True}}
+        category_analysis = pd.DataFrame({
+            'Total Spend': grouped.sum(**engine),
+            'Transactions': grouped.count(),
+            'Average': grouped.mean(**engine),
+            'Minimum': grouped.min(**engine),
+            'Maximum': grouped.max(**engine),
+            'Std Dev': grouped.std(**engine)
+        })
+    else:
+        # Single-column aggregation: flat result columns, no MultiIndex to build and rename
+        category_analysis = grouped.agg(['sum', 'count', 'mean', 'min', 'max', 'std'])
+        category_analysis.columns = ['Total Spend', 'Transactions', 'Average', 'Minimum', 'Maximum', 'Std Dev']
+    category_analysis = category_analysis.round(2).sort_values('Total Spend', ascending=False)
     st.dataframe(category_analysis.reset_index(), use_container_width=True, hide_index=True)
 
 
-def ai_insights_page():
+def ai_insights_page(expenses):
     """AI-powered recommendations, suggestions, and risk factors."""
     st.markdown("<div class='section-header'><span>🤖</span> AI Smart Insights</div>", unsafe_allow_html=True)
     
@@ -855,12 +1277,11 @@ def ai_insights_page():
         st.info("AI features are disabled. Enable 'Enable AI features' in the sidebar to use AI insights.")
         return
 
-    expenses = load_expenses()
     if not expenses or len(expenses) < 5:
         st.info("🤖 AI needs at least 5 transactions to start providing meaningful insights.")
         return
     
-    df = convert_to_dataframe(expenses)
+    df = get_df()
     total_amt = df['amount'].sum()
     
     # AI Summary Card
@@ -884,7 +1305,13 @@ def ai_insights_page():
         st.markdown("### 💡 Recommendations")
         
         # Analyze top category
-        cat_sums = df.groupby('category')['amount'].sum()
+        # Categorical codes are small ints, so bincount totals every category in one pass
+        categories = df['category'].cat.categories
+        codes = df['category'].cat.codes.to_numpy()
+        present = np.bincount(codes, minlength=len(categories)) > 0
+        sums = np.bincount(codes, weights=df['amount'].to_numpy(), minlength=len(categories))
+        cat_sums = pd.Series(sums[present], index=categories[present])
+        present_cats = set(cat_sums.index)
         top_cat = cat_sums.idxmax()
         top_amt = cat_sums.max()
         pct = (top_amt / total_amt) * 100
@@ -895,12 +1322,12 @@ def ai_insights_page():
             st.success(f"**Balanced Budget:** Your spending is well-distributed. No single category dominates your budget.")
             
         # Specific suggestions
-        if 'Food' in df['category'].values:
-            food_total = df[df['category'] == 'Food']['amount'].sum()
+        if 'Food' in present_cats:
+            food_total = cat_sums['Food']
             if food_total > total_amt * 0.3:
                 st.info("🍳 **Quick Tip:** Reducing restaurant visits by 25% could significantly boost your savings.")
         
-        if 'Entertainment' in df['category'].values:
+        if 'Entertainment' in present_cats:
             st.info("🎬 **Subscription Check:** Review your monthly digital subscriptions for any unused services.")
         
         st.markdown("</div>", unsafe_allow_html=True)
@@ -911,13 +1338,15 @@ def ai_insights_page():
         st.markdown("### ⚠️ Financial Risks")
         
         # Risk: Recent spike
-        recent_date = df['date'].max()
-        last_7_days = df[df['date'] >= (recent_date - timedelta(days=7))]
-        prev_7_days = df[(df['date'] < (recent_date - timedelta(days=7))) & (df['date'] >= (recent_date - timedelta(days=14)))]
+        # df is newest-first, so age in days is ascending and both windows are contiguous slices
+        dates = df['date'].to_numpy(dtype='datetime64[D]')
+        ages = (dates[0] - dates).astype(np.int64)
+        week_end, fortnight_end = np.searchsorted(ages, [7, 14], side='right')
+        amounts = df['amount'].to_numpy()
         
-        if not prev_7_days.empty:
-            curr_sum = last_7_days['amount'].sum()
-            prev_sum = prev_7_days['amount'].sum()
+        if fortnight_end > week_end:
+            curr_sum = amounts[:week_end].sum()
+            prev_sum = amounts[week_end:fortnight_end].sum()
             if curr_sum > prev_sum * 1.5:
                 st.error(f"**Spending Spike:** Your spending jumped by {((curr_sum/prev_sum)-1)*100:.1f}% this week.")
             elif curr_sum < prev_sum * 0.8:
@@ -996,8 +1425,8 @@ def main():
     st.sidebar.metric("Total Expenses", len(expenses))
     
     if expenses:
-        df = convert_to_dataframe(expenses)
-        st.sidebar.metric("Total Spending", f"₹{df['amount'].sum():,.2f}")
+        # A plain pass over the loaded list; fetching the cached DataFrame would unpickle a full copy
+        st.sidebar.metric("Total Spending", f"₹{sum(exp['amount'] for exp in expenses):,.2f}")
     
     # Data controls
     col1, col2 = st.sidebar.columns(2)
@@ -1010,11 +1439,9 @@ def main():
     with col2:
         if st.button("📥 Export CSV", key="export_btn"):
             if expenses:
-                df = convert_to_dataframe(expenses)
-                csv = df.to_csv(index=False)
                 st.download_button(
                     label="📥 Download CSV",
-                    data=csv,
+                    data=make_csv_bytes(data_file_key()),
                     file_name=f"expenses_{datetime.now().strftime('%Y%m%d')}.csv",
                     mime="text/csv"
                 )
@@ -1023,16 +1450,18 @@ def main():
     
     # Sample data option
     if st.sidebar.checkbox("📊 Load Sample Data"):
-        if os.path.exists("expenses_sample.json"):
-            with open("expenses_sample.json", 'r') as f:
-                sample_expenses = json.load(f)
-            
+        # The sample file is only parsed when the button is actually pressed
+        if os.path.exists(SAMPLE_FILE):
             if st.sidebar.button("Load Samples"):
-                current = load_expenses()
-                current.extend(sample_expenses)
-                save_expenses(current)
-                st.sidebar.success("✓ Sample data loaded!")
-                st.rerun()
+                try:
+                    samples = read_json_file(SAMPLE_FILE)
+                except JSON_DECODE_ERRORS + (IOError,):
+                    st.sidebar.error("Could not read the sample data file.")
+                else:
+                    expenses.extend(dict(exp, date_ordinal=date_ordinal(exp['date'])) for exp in samples)
+                    save_expenses(expenses)
+                    st.sidebar.success("✓ Sample data loaded!")
+                    st.rerun()
     
     st.sidebar.markdown("---")
     st.sidebar.markdown("""
@@ -1050,15 +1479,15 @@ def main():
     
     # Main content
     if page == "📊 Dashboard":
-        dashboard()
+        dashboard(expenses)
     elif page == "➕ Add Expense":
-        add_expense_page()
+        add_expense_page(expenses)
     elif page == "✏️ Manage":
-        manage_expenses_page()
+        manage_expenses_page(expenses)
     elif page == "📈 Statistics":
-        statistics_page()
+        statistics_page(expenses)
     elif page == "🤖 AI Insights":
-        ai_insights_page()
+        ai_insights_page(expenses)
 
 
 if __name__ == "__main__":
@@ -4,41 +4,201 @@ A command-line application to log, view, and manage daily expenses with data per
 Features include adding expenses, viewing summaries by category and time period, and saving data to JSON.
 """
 
+import atexit
 import json
 import os
+import queue
+import threading
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+# orjson is optional: a C JSON codec that is several times faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configuration
 DATA_FILE = "expenses.json"
 
+# Write-behind saving: at most one pending snapshot, written by a single daemon thread
+_save_queue = queue.Queue(maxsize=1)
+_save_thread = None
+
+def date_ordinal(date):
+    """
+    Convert a YYYY-MM-DD string to days since 1970-01-01.
+    Stored with each expense as "date_ordinal" so the dashboard can skip date parsing.
+    """
+    return (datetime.strptime(date, "%Y-%m-%d") - datetime(1970, 1, 1)).days
+
+
+def date_sort_key(expense):
+    """
+    Sort key for the expense list: its "date_ordinal".
+    Expenses whose date could not be read (e.g. hand-edited) have none and sort first.
+    """
+    return expense.get("date_ordinal", float("-inf"))
+
+
+# expenses.json indent, shared by the web app and the CLI whichever JSON backend each has;
+# 2 because orjson supports no other width, so in-place appends always match the file
+JSON_INDENT = 2
+
+
+def dump_json_bytes(obj):
+    """
+    Serialize to indented UTF-8 JSON (JSON_INDENT spaces), using orjson when it is installed.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=JSON_INDENT).encode("utf-8")
+
+
 def load_expenses():
     """
     Load expenses from the JSON file.
-    Returns a list of expense dictionaries. If file doesn't exist, returns empty list.
+    Returns a list of expense dictionaries sorted by date. If file doesn't exist, returns empty list.
+    Expenses saved without a "date_ordinal" get one, and the file is re-saved once.
+    Dates that aren't YYYY-MM-DD are reported and left without an ordinal, so they stay
+    out of the date-based summaries until fixed with "Edit Expense".
     """
     if os.path.exists(DATA_FILE):
         try:
-            with open(DATA_FILE, 'r') as file:
-                return json.load(file)
+            with open(DATA_FILE, 'rb') as file:
+                data = file.read()
+            expenses = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
         except (json.JSONDecodeError, IOError):
             print("⚠️  Could not read the expense file. Starting with empty list.")
             return []
+        added = 0
+        for exp in expenses:
+            if "date_ordinal" not in exp:
+                try:
+                    exp["date_ordinal"] = date_ordinal(exp["date"])
+                    added += 1
+                except (ValueError, TypeError, KeyError):
+                    print(f"⚠️  Unreadable date {exp.get('date')!r} ({exp.get('description', '')}); use YYYY-MM-DD.")
+        # Files written by save_expenses are already in order, so this is a single linear pass;
+        # it only does real work after the web app has appended a back-dated expense
+        expenses.sort(key=date_sort_key)
+        if added:
+            save_expenses(expenses)
+        return expenses
     return []
 
 
+def _write_expenses_file(expenses):
+    """
+    Write the full expense list atomically: dump to a staging file, then swap it in.
+    Args:
+        expenses (list): List of expense dictionaries to write
+    """
+    staging = DATA_FILE + ".tmp"
+    with open(staging, 'wb') as file:
+        file.write(dump_json_bytes(expenses))
+    os.replace(staging, DATA_FILE)
+
+
+def _append_to_file(expense):
+    """
+    Append a single expense to the JSON file without rewriting earlier entries.
+    Trims the closing bracket of the array and writes only the new entry.
+    Args:
+        expense (dict): The expense to append
+    Returns:
+        bool: False if the file is missing or not a JSON array, so a full write is needed
+    """
+    if not os.path.exists(DATA_FILE) or os.path.getsize(DATA_FILE) == 0:
+        return False
+    
+    # Same layout as a full save: one level of indentation inside the array
+    entry = "\n".join(" " * JSON_INDENT + line for line in dump_json_bytes(expense).decode("utf-8").splitlines())
+    with open(DATA_FILE, 'rb+') as file:
+        file.seek(0, os.SEEK_END)
+        tail_start = max(0, file.tell() - 4096)
+        file.seek(tail_start)
+        tail = file.read().rstrip()
+        if not tail.endswith(b"]"):
+            return False
+        body = tail[:-1].rstrip()
+        separator = "\n" if body.endswith(b"[") else ",\n"
+        file.seek(tail_start + len(body))
+        file.truncate()
+        file.write((separator + entry + "\n]").encode("utf-8"))
+    return True
+
+
+def _save_worker():
+    """
+    Background writer: takes (snapshot, expense) jobs off the save queue and writes them.
+    An expense means append it in place; None (or a failed append) means write the full snapshot.
+    Any failure is reported and the loop keeps running, so later saves and flush_saves still work.
+    """
+    while True:
+        snapshot, expense = _save_queue.get()
+        try:
+            if expense is None or not _append_to_file(expense):
+                _write_expenses_file(snapshot)
+        except Exception as e:
+            print(f"\n❌ Error saving expenses: {e}")
+        finally:
+            _save_queue.task_done()
+
+
+def _submit_save(expenses, expense=None):
+    """
+    Queue a save for the background writer and return immediately.
+    The queue holds one job: a job still waiting is replaced, and the replacement becomes a
+    full write so nothing from the dropped job is lost.
+    Args:
+        expenses (list): Full expense list (copied, so later edits don't race the writer)
+        expense (dict): Expense to append in place, or None for a full write
+    """
+    global _save_thread
+    if _save_thread is None:
+        _save_thread = threading.Thread(target=_save_worker, name="expense-writer", daemon=True)
+        _save_thread.start()
+        atexit.register(flush_saves)
+    
+    snapshot = [dict(exp) for exp in expenses]
+    try:
+        _save_queue.get_nowait()
+        _save_queue.task_done()
+        expense = None
+    except queue.Empty:
+        pass
+    _save_queue.put((snapshot, expense))
+
+
+def flush_saves():
+    """Block until every queued save has been written (registered with atexit)."""
+    _save_queue.join()
+
+
 def save_expenses(expenses):
     """
-    Save expenses to the JSON file.
+    Save expenses to the JSON file, sorted by date_ordinal (the list is sorted in place).
+    The write happens on a background thread, which reports any failure; see _submit_save.
     Args:
         expenses (list): List of expense dictionaries to save
     """
-    try:
-        with open(DATA_FILE, 'w') as file:
-            json.dump(expenses, file, indent=4)
-        print("✓ Expenses saved successfully!")
-    except IOError as e:
-        print(f"❌ Error saving expenses: {e}")
+    expenses.sort(key=date_sort_key)
+    _submit_save(expenses)
+    print("✓ Changes queued for saving.")
+
+
+def append_expense(expense, expenses):
+    """
+    Save a newly added expense by appending it to the file instead of rewriting it.
+    The write happens on a background thread, which reports any failure; see _submit_save.
+    Args:
+        expense (dict): The expense to append
+        expenses (list): Full expense list, saved in full if an in-place append isn't possible
+    """
+    _submit_save(expenses, expense)
+    print("✓ Expense queued for saving.")
 
 
 def add_expense(expenses):
@@ -47,6 +207,8 @@ def add_expense(expenses):
     Prompts user for amount, category, and optional date.
     Args:
         expenses (list): List of current expenses
+    Returns:
+        dict: The new expense, or None if the operation was cancelled
     """
     try:
         print("\n--- Add New Expense ---")
@@ -86,8 +248,8 @@ def add_expense(expenses):
         date_input = input("Enter date (YYYY-MM-DD) or press Enter for today: ").strip()
         if date_input:
             try:
-                datetime.strptime(date_input, "%Y-%m-%d")
-                date = date_input
+                # Normalised, so "2024-1-5" is stored as "2024-01-05"
+                date = datetime.strptime(date_input, "%Y-%m-%d").strftime("%Y-%m-%d")
             except ValueError:
                 print("❌ Invalid date format. Using today's date.")
                 date = datetime.now().strftime("%Y-%m-%d")
@@ -102,15 +264,22 @@ def add_expense(expenses):
             "amount": amount,
             "category": category,
             "date": date,
+            "date_ordinal": date_ordinal(date),
             "description": description,
             "timestamp": datetime.now().isoformat()
         }
         
-        expenses.append(expense)
+        # Keep the list in date order; new expenses are usually the latest, so scan back from the end
+        position = len(expenses)
+        while position and date_sort_key(expenses[position - 1]) > expense["date_ordinal"]:
+            position -= 1
+        expenses.insert(position, expense)
         print(f"✓ Expense added: ₹{amount:.2f} in {category} on {date}")
+        return expense
         
     except KeyboardInterrupt:
         print("\n❌ Operation cancelled.")
+        return None
 
 
 def view_summary(expenses):
@@ -161,12 +330,11 @@ def summary_by_category(expenses):
     for expense in expenses:
         category_totals[expense["category"]] += expense["amount"]
     
+    total = sum(category_totals.values())
     print("\n--- Spending by Category ---")
-    total = 0
     for category in sorted(category_totals.keys()):
         amount = category_totals[category]
-        total += amount
-        percentage = (amount / sum(category_totals.values())) * 100
+        percentage = (amount / total) * 100
         print(f"  {category:<15} ₹{amount:>8.2f} ({percentage:>5.1f}%)")
     print(f"  {'-'*35}")
     print(f"  {'TOTAL':<15} ₹{total:>8.2f} (100.0%)")
@@ -174,13 +342,18 @@ def summary_by_category(expenses):
 
 def overall_summary(expenses):
     """Display overall spending statistics."""
-    total = sum(exp["amount"] for exp in expenses)
+    # Total, highest and lowest gathered in a single pass over the list
+    total = 0
+    max_expense = min_expense = expenses[0]["amount"] if expenses else 0
+    for exp in expenses:
+        amount = exp["amount"]
+        total += amount
+        if amount > max_expense:
+            max_expense = amount
+        elif amount < min_expense:
+            min_expense = amount
     avg = total / len(expenses) if expenses else 0
     
-    amounts = [exp["amount"] for exp in expenses]
-    max_expense = max(amounts) if amounts else 0
-    min_expense = min(amounts) if amounts else 0
-    
     print("\n--- Overall Spending Summary ---")
     print(f"  Total Spending:     ₹{total:.2f}")
     print(f"  Number of Expenses: {len(expenses)}")
@@ -189,6 +362,29 @@ def overall_summary(expenses):
     print(f"  Lowest Expense:     ₹{min_expense:.2f}")
 
 
+def expenses_between(expenses, first, last):
+    """
+    Return the expenses dated between two day ordinals (inclusive).
+    The list is kept sorted by date, so two binary searches find the slice
+    and only the matching expenses are touched.
+    Args:
+        expenses (list): Date-sorted list of expense dictionaries
+        first (int): First day, as days since 1970-01-01
+        last (int): Last day, as days since 1970-01-01
+    """
+    def lower_bound(target):
+        low, high = 0, len(expenses)
+        while low < high:
+            mid = (low + high) // 2
+            if date_sort_key(expenses[mid]) < target:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    
+    return expenses[lower_bound(first):lower_bound(last + 1)]
+
+
 def daily_summary(expenses):
     """Display daily spending summary for a specific date or range."""
     date_input = input("Enter date (YYYY-MM-DD) or leave blank for today: ").strip()
@@ -197,12 +393,13 @@ def daily_summary(expenses):
         date_input = datetime.now().strftime("%Y-%m-%d")
     
     try:
-        datetime.strptime(date_input, "%Y-%m-%d")
+        date_input = datetime.strptime(date_input, "%Y-%m-%d").strftime("%Y-%m-%d")
     except ValueError:
         print("❌ Invalid date format.")
         return
     
-    day_expenses = [exp for exp in expenses if exp["date"] == date_input]
+    day = date_ordinal(date_input)
+    day_expenses = expenses_between(expenses, day, day)
     
     if not day_expenses:
         print(f"❌ No expenses found for {date_input}")
@@ -222,21 +419,17 @@ def weekly_summary(expenses):
     week_start = today - timedelta(days=today.weekday())
     week_end = week_start + timedelta(days=6)
     
-    week_expenses = []
-    for exp in expenses:
-        exp_date = datetime.strptime(exp["date"], "%Y-%m-%d").date()
-        if week_start <= exp_date <= week_end:
-            week_expenses.append(exp)
+    first = date_ordinal(week_start.isoformat())
     
-    if not week_expenses:
-        print(f"❌ No expenses found for this week ({week_start} to {week_end})")
-        return
-    
-    # Group by date
+    # Group the week's slice by date
     daily_totals = defaultdict(float)
-    for exp in week_expenses:
+    for exp in expenses_between(expenses, first, first + 6):
         daily_totals[exp["date"]] += exp["amount"]
     
+    if not daily_totals:
+        print(f"❌ No expenses found for this week ({week_start} to {week_end})")
+        return
+    
     total = sum(daily_totals.values())
     print(f"\n--- Weekly Summary ({week_start} to {week_end}) ---")
     for date in sorted(daily_totals.keys()):
@@ -286,7 +479,8 @@ def view_all_expenses(expenses):
     print(f"{'Date':<12} {'Category':<15} {'Amount':<12} {'Description'}")
     print("-" * 70)
     
-    for exp in sorted(expenses, key=lambda x: x["date"], reverse=True):
+    # expenses is kept sorted by date, so newest-first is just the reverse
+    for exp in reversed(expenses):
         print(f"{exp['date']:<12} {exp['category']:<15} ₹{exp['amount']:>8.2f}  {exp['description']}")
 
 
@@ -368,8 +562,9 @@ def edit_expense(expenses):
             elif edit_choice == "3":
                 new_date = input("Enter new date (YYYY-MM-DD): ").strip()
                 try:
-                    datetime.strptime(new_date, "%Y-%m-%d")
+                    new_date = datetime.strptime(new_date, "%Y-%m-%d").strftime("%Y-%m-%d")
                     expense["date"] = new_date
+                    expense["date_ordinal"] = date_ordinal(new_date)
                     print("✓ Date updated!")
                 except ValueError:
                     print("❌ Invalid date format.")
@@ -463,8 +658,12 @@ def main():
         choice = input("Enter your choice (1-6): ").strip()
         
         if choice == "1":
-            add_expense(expenses)
-            save_expenses(expenses)
+            expense = add_expense(expenses)
+            if expense is not None and expense is expenses[-1]:
+                append_expense(expense, expenses)
+            elif expense is not None:
+                # Back-dated expense: rewrite so the file stays in date order
+                save_expenses(expenses)
         
         elif choice == "2":
             view_summary(expenses)